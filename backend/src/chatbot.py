@@ -32,10 +32,16 @@ Always cite your sources using the format [Source: Article Title (URL)].
 If the context doesn't contain enough information, say so clearly.
 Be concise but thorough in your answers."""
     
-    def answer_question(self, question: str, k: int = 5) -> Dict:
+    def answer_question(
+        self,
+        question: str,
+        k: int = 5,
+        article_id: Optional[str] = None,
+        section: Optional[str] = None,
+    ) -> Dict:
         """Answer a question using the knowledge base with citations."""
-        # Retrieve relevant documents
-        results = self.kb.query(question, k=k)
+        # Retrieve relevant documents, optionally restricted to an article/section
+        results = self.kb.query(question, k=k, article_id=article_id, section=section)
         
         if not results:
             return {
@@ -52,8 +58,10 @@ Be concise but thorough in your answers."""
             metadata = doc.metadata
             title = metadata["title"]
             url = metadata["url"]
+            section_path = metadata.get("section_path")
             
-            context_parts.append(f"From '{title}':\n{chunk}")
+            heading = f"'{title}' ({section_path})" if section_path else f"'{title}'"
+            context_parts.append(f"From {heading}:\n{chunk}")
             
             # Track unique sources
             source_info = {
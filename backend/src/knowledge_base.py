@@ -1,11 +1,13 @@
 import os
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Iterable
 from langchain_community.vectorstores import Chroma
 from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_core.documents import Document
 import chromadb
 from chromadb.config import Settings
 
+from .wiki_fetcher import BOILERPLATE_SECTIONS, LEAD_SECTION
+
 
 class KnowledgeBase:
     """Build and query a searchable knowledge base from Wikipedia articles."""
@@ -25,21 +27,45 @@ class KnowledgeBase:
         self.vectorstore = None
         self.collection_name = "wikipedia_articles"
     
-    def add_articles(self, articles: List[Dict], chunk_size: int = 1000, overlap: int = 200):
-        """Add Wikipedia articles to the knowledge base."""
+    def add_articles(
+        self,
+        articles: List[Dict],
+        chunk_size: int = 1000,
+        overlap: int = 200,
+        skip_sections: Optional[Iterable[str]] = BOILERPLATE_SECTIONS,
+    ):
+        """Add Wikipedia articles to the knowledge base.
+        
+        Articles are chunked section by section; sections whose top-level
+        heading is in `skip_sections` are never embedded.
+        """
+        skip = set(skip_sections or ())
         documents = []
         
         for article in articles:
-            # Split content into chunks
-            content = article["content"]
-            chunks = self._chunk_content(content, chunk_size, overlap)
+            # Fall back to the flat content when the article was not split
+            sections = article.get("sections") or [{
+                "section": LEAD_SECTION,
+                "section_path": LEAD_SECTION,
+                "content": article["content"],
+            }]
+            
+            chunks = []
+            for section in sections:
+                if section["section"] in skip:
+                    continue
+                for chunk in self._chunk_content(section["content"], chunk_size, overlap):
+                    chunks.append((section, chunk))
             
-            for i, chunk in enumerate(chunks):
+            for i, (section, chunk) in enumerate(chunks):
                 doc = Document(
                     page_content=chunk,
                     metadata={
+                        "article_id": article.get("article_id", article["title"]),
                         "title": article["title"],
                         "url": article["url"],
+                        "section": section["section"],
+                        "section_path": section["section_path"],
                         "chunk_index": i,
                         "total_chunks": len(chunks),
                     }
@@ -83,8 +109,18 @@ class KnowledgeBase:
         
         return chunks
     
-    def query(self, question: str, k: int = 5) -> List[Tuple[Document, float]]:
-        """Query the knowledge base for relevant documents."""
+    def query(
+        self,
+        question: str,
+        k: int = 5,
+        article_id: Optional[str] = None,
+        section: Optional[str] = None,
+    ) -> List[Tuple[Document, float]]:
+        """Query the knowledge base for relevant documents.
+        
+        `article_id` and `section` restrict the search to matching chunks;
+        `section` matches either a top-level heading or a full section path.
+        """
         if self.vectorstore is None:
             # Try to load existing vectorstore
             try:
@@ -98,10 +134,24 @@ class KnowledgeBase:
                 return []
         
         results = self.vectorstore.similarity_search_with_relevance_scores(
-            question, k=k
+            question, k=k, filter=self._build_filter(article_id, section)
         )
         return results
     
+    def _build_filter(self, article_id: Optional[str], section: Optional[str]) -> Optional[Dict]:
+        """Build a Chroma metadata filter from the optional query filters."""
+        conditions = []
+        if article_id:
+            conditions.append({"article_id": article_id})
+        if section:
+            conditions.append({"$or": [{"section": section}, {"section_path": section}]})
+        
+        if not conditions:
+            return None
+        if len(conditions) == 1:
+            return conditions[0]
+        return {"$and": conditions}
+    
     def clear(self):
         """Clear the knowledge base."""
         try:
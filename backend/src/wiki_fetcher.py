@@ -3,6 +3,14 @@ from typing import List, Dict, Optional
 import re
 
 
+# Sections that carry navigation/citation boilerplate rather than article prose
+BOILERPLATE_SECTIONS = {"See also", "References", "External links", "Further reading", "Notes"}
+
+LEAD_SECTION = "Introduction"
+
+SECTION_HEADING = re.compile(r'^(={2,})\s*(.+?)\s*\1\s*$', re.MULTILINE)
+
+
 class WikipediaFetcher:
     """Fetch and process Wikipedia articles."""
     
@@ -23,10 +31,12 @@ class WikipediaFetcher:
         try:
             page = wikipedia.page(title, auto_suggest=False)
             return {
+                "article_id": str(page.pageid),
                 "title": page.title,
                 "content": page.content,
                 "url": page.url,
                 "summary": page.summary,
+                "sections": self.split_sections(page.content),
             }
         except wikipedia.DisambiguationError as e:
             print(f"Disambiguation error for '{title}': {e.options}")
@@ -50,6 +60,40 @@ class WikipediaFetcher:
         
         return articles
     
+    def split_sections(self, content: str) -> List[Dict]:
+        """Split article content on its `== Section ==` headings.
+        
+        Each entry carries the top-level heading and the full heading path
+        (e.g. "History > Early life"); text before the first heading is the lead.
+        """
+        sections = []
+        path = [LEAD_SECTION]
+        start = 0
+        
+        for match in SECTION_HEADING.finditer(content):
+            text = content[start:match.start()].strip()
+            if text:
+                sections.append({
+                    "section": path[0],
+                    "section_path": " > ".join(path),
+                    "content": text,
+                })
+            
+            # "==" is depth 0, "===" is depth 1, ...
+            depth = len(match.group(1)) - 2
+            path = path[:depth] + [match.group(2)]
+            start = match.end()
+        
+        text = content[start:].strip()
+        if text:
+            sections.append({
+                "section": path[0],
+                "section_path": " > ".join(path),
+                "content": text,
+            })
+        
+        return sections
+    
     def chunk_content(self, content: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
         """Split content into overlapping chunks for better retrieval."""
         chunks = []
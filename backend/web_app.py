@@ -42,8 +42,11 @@ class BuildRequest(BaseModel):
 
 class QuestionRequest(BaseModel):
     question: str
+    article_id: Optional[str] = None   # restrict retrieval to one article
+    section: Optional[str] = None      # top-level heading or "A > B" section path
 
 class ArticleInfo(BaseModel):
+    article_id: str = ""
     title: str
     url: str
     summary: str = ""
@@ -145,7 +148,8 @@ async def build_kb(request: BuildRequest):
 
         current_topic = request.topic
         indexed_articles = [
-            {"title": a["title"], "url": a["url"], "summary": a.get("summary", "")[:200]}
+            {"article_id": a.get("article_id", ""), "title": a["title"], "url": a["url"],
+             "summary": a.get("summary", "")[:200]}
             for a in articles_data
         ]
         conversation_history = []
@@ -178,7 +182,12 @@ async def ask_question(request: QuestionRequest):
         raise HTTPException(status_code=400, detail="Knowledge base not built yet. Index a topic first.")
 
     try:
-        result = await asyncio.to_thread(chatbot.answer_question, request.question)
+        result = await asyncio.to_thread(
+            chatbot.answer_question,
+            request.question,
+            article_id=request.article_id,
+            section=request.section,
+        )
 
         sources = [
             SourceInfo(title=s["title"], url=s["url"], relevance_score=s["relevance_score"])